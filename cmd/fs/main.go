@@ -1,10 +1,15 @@
 package main
 
 import (
+	"bufio"
 	"encoding/json"
+	"errors"
 	"fmt"
+	"io"
 	"os"
+	"slices"
 	"strconv"
+	"strings"
 
 	"github.com/dorcha-inc/orla-tool-fs/internal/fs"
 	"github.com/spf13/cobra"
@@ -31,39 +36,35 @@ func main() {
 		Long:  "A comprehensive file system operations tool for orla",
 	}
 
-	var operation string
-	rootCmd.PersistentFlags().StringVar(&operation, "operation", "", "Operation: read, write, list, exists, stat, mkdir, rm, mv, cp")
+	names := make([]string, 0, len(operations))
+	for name := range operations {
+		names = append(names, name)
+	}
+	slices.Sort(names)
 
-	rootCmd.PersistentFlags().String("path", "", "Path to file or directory")
-	rootCmd.PersistentFlags().String("source", "", "Source path (for mv, cp)")
-	rootCmd.PersistentFlags().String("dest", "", "Destination path (for mv, cp)")
-	rootCmd.PersistentFlags().String("content", "", "Content to write")
-	rootCmd.PersistentFlags().String("recursive", "false", "Recursive operation")
-	rootCmd.PersistentFlags().String("parents", "false", "Create parent directories")
-	rootCmd.PersistentFlags().String("create-dirs", "false", "Create parent directories")
+	var opName string
+	rootCmd.PersistentFlags().StringVar(&opName, "operation", "", "Operation: "+strings.Join(names, ", "))
 
-	// Add subcommands for each operation
-	subCommandMap := map[string]*cobra.Command{
-		"read":   newReadCmd(),
-		"write":  newWriteCmd(),
-		"list":   newListCmd(),
-		"exists": newExistsCmd(),
-		"stat":   newStatCmd(),
-		"mkdir":  newMkdirCmd(),
-		"rm":     newRmCmd(),
-		"mv":     newMvCmd(),
-		"cp":     newCpCmd(),
-	}
+	addRequestFlags(rootCmd)
+	rootCmd.PersistentFlags().String("stream", "false", "Stream list items as newline-delimited JSON")
+	rootCmd.PersistentFlags().String("serve", "false", "Serve newline-delimited JSON requests from stdin")
 
-	for _, cmd := range subCommandMap {
+	// Add a subcommand for each operation
+	subCommandMap := make(map[string]*cobra.Command, len(operations))
+	for name, op := range operations {
+		cmd := newOperationCmd(name, op)
+		subCommandMap[name] = cmd
 		rootCmd.AddCommand(cmd)
 	}
 
 	rootCmd.RunE = func(cmd *cobra.Command, args []string) error {
-		if operation != "" {
-			subCmd, ok := subCommandMap[operation]
+		if toBool(getFlagOrFatal(cmd, "serve")) {
+			return serve(os.Stdin, os.Stdout)
+		}
+		if opName != "" {
+			subCmd, ok := subCommandMap[opName]
 			if !ok {
-				return fmt.Errorf("unknown operation: %s", operation)
+				return fmt.Errorf("unknown operation: %s", opName)
 			}
 			return subCmd.RunE(subCmd, args)
 		}
@@ -76,174 +77,169 @@ func main() {
 	}
 }
 
-func newReadCmd() *cobra.Command {
-	cmd := &cobra.Command{
-		Use:   "read",
-		Short: "Read file contents",
+// newOperationCmd returns the subcommand for the named operation. All flags
+// are inherited from the root persistent flags and gathered into a request,
+// so the subcommand runs exactly what serve mode runs for the same request.
+func newOperationCmd(name string, op opSpec) *cobra.Command {
+	return &cobra.Command{
+		Use:   name,
+		Short: op.short,
 		RunE: func(cmd *cobra.Command, args []string) error {
-			// Get path from root persistent flags
-			path := getFlagOrFatal(cmd, "path")
-			result := fs.Read(path)
-			mcpOutput(result)
-			if !getBool(result, "success") {
+			req := requestFromFlags(cmd, op)
+			req.Operation = name
+
+			var result map[string]any
+			if name == "list" && toBool(getFlagOrFatal(cmd, "stream")) {
+				result = listStream(req.Path, req.Recursive)
+			} else {
+				result = op.run(req)
+				mcpOutput(result)
+			}
+			// exists has never reported failure through the exit status.
+			if name != "exists" && !getBool(result, "success") {
 				os.Exit(1)
 			}
 			return nil
 		},
 	}
-	// Flags are inherited from root persistent flags
-	return cmd
 }
 
-func newWriteCmd() *cobra.Command {
-	cmd := &cobra.Command{
-		Use:   "write",
-		Short: "Write file contents",
-		RunE: func(cmd *cobra.Command, args []string) error {
-			path := getFlagOrFatal(cmd, "path")
-			content := getFlagOrFatal(cmd, "content")
-			createDirsStr := getFlagOrFatal(cmd, "create-dirs")
-			createDirs := toBool(createDirsStr)
-
-			result := fs.Write(path, content, createDirs)
-
-			mcpOutput(result)
-			if !getBool(result, "success") {
-				os.Exit(1)
-			}
+// addRequestFlags registers the persistent flags that requestFromFlags reads.
+func addRequestFlags(cmd *cobra.Command) {
+	cmd.PersistentFlags().String("path", "", "Path to file or directory")
+	cmd.PersistentFlags().String("source", "", "Source path (for mv, cp)")
+	cmd.PersistentFlags().String("dest", "", "Destination path (for mv, cp)")
+	cmd.PersistentFlags().String("content", "", "Content to write")
+	cmd.PersistentFlags().String("recursive", "false", "Recursive operation")
+	cmd.PersistentFlags().String("parents", "false", "Create parent directories")
+	cmd.PersistentFlags().String("create-dirs", "false", "Create parent directories")
+}
 
-			return nil
-		},
+// requestFromFlags builds a request for op from the root persistent flags
+// (where MCP sets them). Only the boolean flags op uses are parsed, so a
+// malformed value for a flag the operation ignores is not an error.
+func requestFromFlags(cmd *cobra.Command, op opSpec) *request {
+	req := &request{
+		Path:    getFlagOrFatal(cmd, "path"),
+		Source:  getFlagOrFatal(cmd, "source"),
+		Dest:    getFlagOrFatal(cmd, "dest"),
+		Content: getFlagOrFatal(cmd, "content"),
+	}
+	for _, flag := range op.boolFlags {
+		value := toBool(getFlagOrFatal(cmd, flag))
+		switch flag {
+		case "recursive":
+			req.Recursive = value
+		case "parents":
+			req.Parents = value
+		case "create-dirs":
+			req.CreateDirs = value
+		}
 	}
-	return cmd
+	return req
 }
 
-func newListCmd() *cobra.Command {
-	cmd := &cobra.Command{
-		Use:   "list",
-		Short: "List directory contents",
-		RunE: func(cmd *cobra.Command, args []string) error {
-			path := getFlagOrFatal(cmd, "path")
-			recursiveStr := getFlagOrFatal(cmd, "recursive")
-			recursive := toBool(recursiveStr)
-			result := fs.List(path, recursive)
+// listStream writes one compact JSON object per directory item to stdout as
+// the listing proceeds, followed by the final result object, and returns that
+// result.
+func listStream(path string, recursive bool) map[string]any {
+	w := bufio.NewWriterSize(os.Stdout, 64*1024)
+	enc := json.NewEncoder(w)
+	enc.SetEscapeHTML(false)
 
-			mcpOutput(result)
-			if !getBool(result, "success") {
-				os.Exit(1)
-			}
-			return nil
-		},
+	result := fs.ListStream(path, recursive, func(item map[string]any) error {
+		return enc.Encode(item)
+	})
+	err := enc.Encode(result)
+	if err == nil {
+		err = w.Flush()
 	}
-	return cmd
-}
-
-func newExistsCmd() *cobra.Command {
-	cmd := &cobra.Command{
-		Use:   "exists",
-		Short: "Check if path exists",
-		RunE: func(cmd *cobra.Command, args []string) error {
-			path := getFlagOrFatal(cmd, "path")
-			result := fs.Exists(path)
-			mcpOutput(result)
-			return nil
-		},
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "Error encoding output: %v\n", err)
+		os.Exit(1)
 	}
-	return cmd
+	return result
 }
 
-func newStatCmd() *cobra.Command {
-	cmd := &cobra.Command{
-		Use:   "stat",
-		Short: "Get file/directory statistics",
-		RunE: func(cmd *cobra.Command, args []string) error {
-			path := getFlagOrFatal(cmd, "path")
-			result := fs.Stat(path)
-			mcpOutput(result)
-			if !getBool(result, "success") {
-				os.Exit(1)
-			}
-			return nil
-		},
-	}
-	return cmd
+// request is a single operation in serve mode. The field names match the
+// tool's input schema.
+type request struct {
+	Operation  string `json:"operation"`
+	Path       string `json:"path"`
+	Source     string `json:"source"`
+	Dest       string `json:"dest"`
+	Content    string `json:"content"`
+	Recursive  bool   `json:"recursive"`
+	Parents    bool   `json:"parents"`
+	CreateDirs bool   `json:"create_dirs"`
 }
 
-func newMkdirCmd() *cobra.Command {
-	cmd := &cobra.Command{
-		Use:   "mkdir",
-		Short: "Create directory",
-		RunE: func(cmd *cobra.Command, args []string) error {
-			path := getFlagOrFatal(cmd, "path")
-			parentsStr := getFlagOrFatal(cmd, "parents")
-			parents := toBool(parentsStr)
-			result := fs.Mkdir(path, parents)
-			mcpOutput(result)
-			if !getBool(result, "success") {
-				os.Exit(1)
-			}
-			return nil
-		},
-	}
-	// Flags are inherited from root persistent flags
-	return cmd
+// opSpec is one tool operation: the help text for its subcommand, the
+// boolean flags it reads and the fs call that implements it for a request.
+type opSpec struct {
+	short     string
+	boolFlags []string
+	run       func(r *request) map[string]any
 }
 
-func newRmCmd() *cobra.Command {
-	cmd := &cobra.Command{
-		Use:   "rm",
-		Short: "Remove file or directory",
-		RunE: func(cmd *cobra.Command, args []string) error {
-			path := getFlagOrFatal(cmd, "path")
-			recursiveStr := getFlagOrFatal(cmd, "recursive")
-			recursive := toBool(recursiveStr)
-			result := fs.Rm(path, recursive)
-			mcpOutput(result)
-			if !getBool(result, "success") {
-				os.Exit(1)
-			}
-			return nil
-		},
-	}
-	return cmd
+// operations is the single list of supported operations. Both the cobra
+// subcommands and serve mode are built from it, so adding an operation means
+// adding one entry here.
+var operations = map[string]opSpec{
+	"read":   {"Read file contents", nil, func(r *request) map[string]any { return fs.Read(r.Path) }},
+	"write":  {"Write file contents", []string{"create-dirs"}, func(r *request) map[string]any { return fs.Write(r.Path, r.Content, r.CreateDirs) }},
+	"list":   {"List directory contents", []string{"recursive"}, func(r *request) map[string]any { return fs.List(r.Path, r.Recursive) }},
+	"exists": {"Check if path exists", nil, func(r *request) map[string]any { return fs.Exists(r.Path) }},
+	"stat":   {"Get file/directory statistics", nil, func(r *request) map[string]any { return fs.Stat(r.Path) }},
+	"mkdir":  {"Create directory", []string{"parents"}, func(r *request) map[string]any { return fs.Mkdir(r.Path, r.Parents) }},
+	"rm":     {"Remove file or directory", []string{"recursive"}, func(r *request) map[string]any { return fs.Rm(r.Path, r.Recursive) }},
+	"mv":     {"Move or rename file/directory", nil, func(r *request) map[string]any { return fs.Mv(r.Source, r.Dest) }},
+	"cp":     {"Copy file or directory", []string{"recursive"}, func(r *request) map[string]any { return fs.Cp(r.Source, r.Dest, r.Recursive) }},
 }
 
-func newMvCmd() *cobra.Command {
-	cmd := &cobra.Command{
-		Use:   "mv",
-		Short: "Move or rename file/directory",
-		RunE: func(cmd *cobra.Command, args []string) error {
-			source := getFlagOrFatal(cmd, "source")
-			dest := getFlagOrFatal(cmd, "dest")
-			result := fs.Mv(source, dest)
-			mcpOutput(result)
-			if !getBool(result, "success") {
-				os.Exit(1)
-			}
-			return nil
-		},
+func (r *request) run() map[string]any {
+	op, ok := operations[r.Operation]
+	if !ok {
+		return map[string]any{"error": fmt.Sprintf("unknown operation: %s", r.Operation), "success": false}
 	}
-	return cmd
+	return op.run(r)
 }
 
-func newCpCmd() *cobra.Command {
-	cmd := &cobra.Command{
-		Use:   "cp",
-		Short: "Copy file or directory",
-		RunE: func(cmd *cobra.Command, args []string) error {
-			source := getFlagOrFatal(cmd, "source")
-			dest := getFlagOrFatal(cmd, "dest")
-			recursiveStr := getFlagOrFatal(cmd, "recursive")
-			recursive := toBool(recursiveStr)
-			result := fs.Cp(source, dest, recursive)
-			mcpOutput(result)
-			if !getBool(result, "success") {
-				os.Exit(1)
-			}
+// serve reads newline-delimited JSON requests from in and writes one compact
+// JSON result per line to out until in is exhausted. This lets a client run
+// many operations against a single process instead of starting one per
+// operation. A request with a field of the wrong type gets an error result;
+// malformed JSON ends the session since the stream cannot be resynchronised.
+func serve(in io.Reader, out io.Writer) error {
+	dec := json.NewDecoder(in)
+	w := bufio.NewWriter(out)
+	enc := json.NewEncoder(w)
+	enc.SetEscapeHTML(false)
+
+	for {
+		var req request
+		var result map[string]any
+		err := dec.Decode(&req)
+		if errors.Is(err, io.EOF) {
 			return nil
-		},
+		}
+		var typeErr *json.UnmarshalTypeError
+		if errors.As(err, &typeErr) {
+			result = map[string]any{"error": fmt.Sprintf("invalid request: %v", err), "success": false}
+		} else if err != nil {
+			return fmt.Errorf("failed to decode request: %w", err)
+		} else {
+			result = req.run()
+		}
+
+		if err := enc.Encode(result); err != nil {
+			return err
+		}
+		// Flush after every result so clients can wait for each response.
+		if err := w.Flush(); err != nil {
+			return err
+		}
 	}
-	return cmd
 }
 
 func toBool(s string) bool {
@@ -265,6 +261,9 @@ func getBool(m map[string]any, key string) bool {
 func mcpOutput(v any) {
 	enc := json.NewEncoder(os.Stdout)
 	enc.SetIndent("", "  ")
+	// Output is consumed as JSON, never embedded in HTML, so skip escaping
+	// <, > and & in file contents and paths into six-byte \u sequences.
+	enc.SetEscapeHTML(false)
 	err := enc.Encode(v)
 	if err != nil {
 		fmt.Fprintf(os.Stderr, "Error encoding output: %v\n", err)
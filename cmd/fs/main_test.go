@@ -0,0 +1,87 @@
+package main
+
+import (
+	"bytes"
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/spf13/cobra"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestServe(t *testing.T) {
+	tmpDir := t.TempDir()
+	testFile := filepath.Join(tmpDir, "test.txt")
+
+	requests := []map[string]any{
+		{"operation": "write", "path": testFile, "content": "hello"},
+		{"operation": "read", "path": testFile},
+		{"operation": "exists", "path": filepath.Join(tmpDir, "missing")},
+		{"operation": "list", "path": tmpDir, "recursive": "yes"},
+		{"operation": "bogus"},
+	}
+	var in bytes.Buffer
+	enc := json.NewEncoder(&in)
+	for _, req := range requests {
+		require.NoError(t, enc.Encode(req))
+	}
+
+	var out bytes.Buffer
+	require.NoError(t, serve(&in, &out))
+
+	lines := strings.Split(strings.TrimSuffix(out.String(), "\n"), "\n")
+	require.Len(t, lines, len(requests))
+
+	results := make([]map[string]any, len(lines))
+	for i, line := range lines {
+		require.NoError(t, json.Unmarshal([]byte(line), &results[i]))
+	}
+
+	assert.Equal(t, true, results[0]["success"])
+	//nolint:gosec // Test file paths are safe - constructed from test temp directories
+	data, err := os.ReadFile(testFile)
+	require.NoError(t, err)
+	assert.Equal(t, "hello", string(data))
+
+	assert.Equal(t, true, results[1]["success"])
+	assert.Equal(t, "hello", results[1]["content"])
+
+	assert.Equal(t, true, results[2]["success"])
+	assert.Equal(t, false, results[2]["exists"])
+
+	assert.Equal(t, false, results[3]["success"], "wrongly typed field should be rejected")
+
+	assert.Equal(t, false, results[4]["success"])
+	assert.Equal(t, "unknown operation: bogus", results[4]["error"])
+}
+
+func TestServeMalformedRequest(t *testing.T) {
+	var out bytes.Buffer
+	err := serve(strings.NewReader("{not json}\n"), &out)
+	assert.Error(t, err)
+}
+
+func TestRequestFromFlagsIgnoresUnusedFlags(t *testing.T) {
+	rootCmd := &cobra.Command{Use: "fs"}
+	addRequestFlags(rootCmd)
+	cmd := newOperationCmd("read", operations["read"])
+	rootCmd.AddCommand(cmd)
+	require.NoError(t, rootCmd.PersistentFlags().Set("path", "/tmp/file"))
+	require.NoError(t, rootCmd.PersistentFlags().Set("recursive", "yes"))
+	require.NoError(t, rootCmd.PersistentFlags().Set("parents", "yes"))
+
+	// read uses no boolean flags, so malformed ones must not be parsed.
+	req := requestFromFlags(cmd, operations["read"])
+	assert.Equal(t, "/tmp/file", req.Path)
+	assert.False(t, req.Recursive)
+	assert.False(t, req.Parents)
+
+	require.NoError(t, rootCmd.PersistentFlags().Set("recursive", "true"))
+	req = requestFromFlags(cmd, operations["rm"])
+	assert.True(t, req.Recursive)
+	assert.False(t, req.Parents)
+}
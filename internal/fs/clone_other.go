@@ -0,0 +1,13 @@
+//go:build !linux
+
+package fs
+
+import (
+	"errors"
+	"os"
+)
+
+// cloneFile is not supported on this platform; callers copy the data instead.
+func cloneFile(_, _ *os.File) error {
+	return errors.ErrUnsupported
+}
@@ -2,12 +2,16 @@
 package fs
 
 import (
+	"errors"
 	"fmt"
+	"io"
 	"io/fs"
 	"os"
 	"path/filepath"
 	"strings"
+	"syscall"
 	"unicode/utf8"
+	"unsafe"
 
 	copyutil "github.com/otiai10/copy"
 )
@@ -17,16 +21,30 @@ func mcpError(err error) map[string]any {
 	return map[string]any{"error": err.Error(), "success": false}
 }
 
+// mcpPathError reports err from an operation on path. Permission errors get a
+// short message naming the path as the user gave it, matched on the
+// underlying errno so wrapped errors are recognised too; anything else is
+// reported as is.
+func mcpPathError(err error, path string) map[string]any {
+	if errors.Is(err, fs.ErrPermission) {
+		return mcpError(fmt.Errorf("permission denied: %s", path))
+	}
+	return mcpError(err)
+}
+
 // mcpSuccess sets the success flag to true and returns the result. It
 // takes multiple name-value pairs (name must be string, value can be any type)
 // and returns a map[string]any.
 func mcpSuccess(nameValuePairs ...any) map[string]any {
-	result := map[string]any{"success": true}
-
 	if len(nameValuePairs)%2 != 0 {
 		return mcpError(fmt.Errorf("odd number of name-value pairs"))
 	}
 
+	// Size the map for every field up front so results with many fields, such
+	// as Stat's, are not rehashed while being filled in.
+	result := make(map[string]any, 1+len(nameValuePairs)/2)
+	result["success"] = true
+
 	for i := 0; i < len(nameValuePairs); i += 2 {
 		name, ok := nameValuePairs[i].(string)
 		if !ok {
@@ -59,8 +77,9 @@ func ExpandPath(p string) (rtn string, err error) {
 			return home, nil
 		}
 
-		rtn = strings.Replace(p, "~", home, 1)
-		return rtn, nil
+		// p is known to start with "~/", so splice the home directory in
+		// directly instead of searching for the tilde again.
+		return home + p[1:], nil
 	}
 
 	return p, nil
@@ -77,33 +96,67 @@ func Read(path string) map[string]any {
 		return mcpError(err)
 	}
 
-	info, err := os.Stat(p)
-
+	// G304: This is a file system tool designed to read user-provided paths.
+	// The path is cleaned via ExpandPath and checked to be a regular file below.
+	f, err := openForRead(p)
 	if err != nil {
-		if os.IsNotExist(err) {
+		if errors.Is(err, fs.ErrNotExist) {
 			return mcpError(fmt.Errorf("file not found: %s", path))
 		}
+		return mcpPathError(err, path)
+	}
+	//nolint:errcheck // Read-only descriptor; a close error cannot lose data
+	defer f.Close()
+
+	// Stat the open descriptor rather than the path so the existence check,
+	// the type check and the size used to size the read buffer all come from
+	// a single fstat.
+	info, err := f.Stat()
+	if err != nil {
 		return mcpError(err)
 	}
 
-	if info.IsDir() {
+	// Reject directories, FIFOs, sockets and devices: reading them could block
+	// indefinitely or never reach EOF.
+	if !info.Mode().IsRegular() {
 		return mcpError(fmt.Errorf("path is not a file: %s", path))
 	}
 
-	// G304: This is a file system tool designed to read user-provided paths.
-	// The path is validated (checked for existence, type) and cleaned via ExpandPath.
-	//nolint:gosec // File system tool - user-provided paths are expected and validated
-	data, err := os.ReadFile(p)
+	adviseSequential(f)
+	data, err := readContent(f, info.Size())
 	if err != nil {
-		if os.IsPermission(err) {
-			return mcpError(fmt.Errorf("permission denied: %s", path))
-		}
-		return mcpError(err)
+		return mcpPathError(err, path)
 	}
 	if !utf8.Valid(data) {
 		return mcpError(fmt.Errorf("file is not valid UTF-8: %s", path))
 	}
-	return mcpSuccess("content", string(data))
+
+	// The buffer was allocated for this call alone and is never written
+	// again, so the string takes it over instead of copying it.
+	//nolint:gosec // G103: the slice has no other references after this point
+	return mcpSuccess("content", unsafe.String(unsafe.SliceData(data), len(data)))
+}
+
+// readContent reads f to EOF. The buffer is sized from the fstat result so the
+// common case is one allocation and a single read syscall; files that report
+// no size (e.g. procfs) or that grow while being read fall back to growing the
+// buffer, and files that shrink simply return what was read.
+func readContent(f *os.File, size int64) ([]byte, error) {
+	// One extra byte lets the read that hits EOF land in the same buffer.
+	data := make([]byte, 0, int(size)+1)
+	for {
+		n, err := f.Read(data[len(data):cap(data)])
+		data = data[:len(data)+n]
+		if err != nil {
+			if errors.Is(err, io.EOF) {
+				return data, nil
+			}
+			return nil, err
+		}
+		if len(data) == cap(data) {
+			data = append(data, 0)[:len(data)]
+		}
+	}
 }
 
 // Write writes content to a file
@@ -130,20 +183,52 @@ func Write(path, content string, createDirs bool) map[string]any {
 		}
 	}
 
+	if err := writeContent(p, content); err != nil {
+		return mcpPathError(err, path)
+	}
+	return mcpSuccess("path", p)
+}
+
+// writeContent truncates or creates the file at p and writes content to it.
+// Unlike os.WriteFile it takes the string as is: (*os.File).WriteString hands
+// the string's bytes straight to write(2) instead of copying them into a new
+// []byte first, and short writes are retried by the os package.
+func writeContent(p, content string) (err error) {
 	// G304: This is a file system tool designed to write to a file.
 	// The path is validated and cleaned via ExpandPath before reaching this function.
 	//nolint:gosec // File system tool - user-provided paths are expected and validated
-	if err := os.WriteFile(p, []byte(content), 0644); err != nil {
-		if os.IsPermission(err) {
-			return mcpError(fmt.Errorf("permission denied: %s", path))
-		}
-		return mcpError(err)
+	f, err := os.OpenFile(p, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0644)
+	if err != nil {
+		return err
 	}
-	return mcpSuccess("path", p)
+	defer func() {
+		if closeErr := f.Close(); err == nil {
+			err = closeErr
+		}
+	}()
+	_, err = f.WriteString(content)
+	return err
 }
 
 // List lists directory contents
 func List(path string, recursive bool) map[string]any {
+	var items []map[string]any
+	result := ListStream(path, recursive, func(item map[string]any) error {
+		items = append(items, item)
+		return nil
+	})
+	if result["success"] == true {
+		result["items"] = items
+	}
+	return result
+}
+
+// ListStream lists directory contents like List, but hands each item to emit
+// as soon as it is read instead of collecting them, so memory does not grow
+// with the size of the tree. The returned result carries the item count but
+// no items. An error returned by emit stops the listing and is reported in
+// the result.
+func ListStream(path string, recursive bool, emit func(item map[string]any) error) map[string]any {
 	if path == "" {
 		return mcpError(fmt.Errorf("path is required"))
 	}
@@ -155,7 +240,7 @@ func List(path string, recursive bool) map[string]any {
 
 	info, err := os.Stat(p)
 	if err != nil {
-		if os.IsNotExist(err) {
+		if errors.Is(err, fs.ErrNotExist) {
 			return mcpError(fmt.Errorf("directory not found: %s", path))
 		}
 		return mcpError(err)
@@ -165,69 +250,56 @@ func List(path string, recursive bool) map[string]any {
 		return mcpError(fmt.Errorf("path is not a directory: %s", path))
 	}
 
-	var items []map[string]any
-	if recursive {
-		err = filepath.WalkDir(p, func(walkPath string, d fs.DirEntry, err error) error {
-			if err != nil {
-				return err
-			}
-
-			// Skip the root directory itself
-			if walkPath == p {
-				return nil
-			}
-
-			entryInfo, err := d.Info()
-			if err != nil {
-				return err
-			}
-
-			rel, relErr := filepath.Rel(p, walkPath)
-			if relErr != nil {
-				// Fallback to entry name if relative path calculation fails
-				rel = d.Name()
-			}
+	// Every entry path is the cleaned root followed by a separator, so build
+	// paths by concatenation and take relative paths as a suffix rather than
+	// going through filepath.Join and filepath.Rel for each entry.
+	prefix := p
+	if !os.IsPathSeparator(p[len(p)-1]) {
+		prefix += string(filepath.Separator)
+	}
 
-			items = append(items, map[string]any{
+	count := 0
+	if recursive {
+		rootLen := len(prefix)
+
+		w := newWalker()
+		err = w.walk(prefix, w.read(p), func(walkPath string, d fs.DirEntry) error {
+			count++
+			// The entry type comes from the directory listing itself, so no
+			// per-entry stat is needed.
+			return emit(map[string]any{
 				"path":     walkPath,
 				"name":     d.Name(),
-				"type":     itemType(entryInfo),
-				"relative": rel,
+				"type":     itemType(d),
+				"relative": walkPath[rootLen:],
 			})
-
-			return nil
 		})
 
 		if err != nil {
-			if os.IsPermission(err) {
-				return mcpError(fmt.Errorf("permission denied: %s", path))
-			}
-			return mcpError(err)
+			return mcpPathError(err, path)
 		}
 
-		return mcpSuccess("items", items, "count", len(items))
+		return mcpSuccess("count", count)
 	}
 
 	entries, err := os.ReadDir(p)
 	if err != nil {
-		if os.IsPermission(err) {
-			return mcpError(fmt.Errorf("permission denied: %s", path))
-		}
-		return mcpError(err)
+		return mcpPathError(err, path)
 	}
 	for _, entry := range entries {
-		info, err := entry.Info()
+		name := entry.Name()
+		count++
+		err = emit(map[string]any{
+			"path": prefix + name,
+			"name": name,
+			"type": itemType(entry),
+		})
 		if err != nil {
-			return mcpError(err)
+			return mcpPathError(err, path)
 		}
-		items = append(items, map[string]any{
-			"path": filepath.Join(p, entry.Name()),
-			"name": entry.Name(),
-			"type": itemType(info),
-		})
 	}
 
-	return mcpSuccess("items", items, "count", len(items))
+	return mcpSuccess("count", count)
 }
 
 // Exists checks if a path exists
@@ -249,7 +321,7 @@ func Exists(path string) map[string]any {
 		return result
 	}
 
-	if !os.IsNotExist(err) {
+	if !errors.Is(err, fs.ErrNotExist) {
 		// If the error is not "doesn't exist", it's another error (e.g., permission denied)
 		// Return error instead of just "exists: false"
 		return mcpError(err)
@@ -269,7 +341,7 @@ func Stat(path string) map[string]any {
 	}
 	info, err := os.Stat(p)
 	if err != nil {
-		if os.IsNotExist(err) {
+		if errors.Is(err, fs.ErrNotExist) {
 			return mcpError(fmt.Errorf("path not found: %s", path))
 		}
 		return mcpError(err)
@@ -298,29 +370,25 @@ func Mkdir(path string, parents bool) map[string]any {
 	if err != nil {
 		return mcpError(err)
 	}
-	info, err := os.Stat(p)
-	if err == nil {
-		if info.IsDir() {
-			return mcpSuccess("path", p, "message", "directory already exists")
-		}
-		return mcpError(fmt.Errorf("path exists but is not a directory: %s", path))
-	}
-	if parents {
-		// G301: This is a file system tool designed to create directories.
-		// The path is validated and cleaned via ExpandPath before reaching this function.
+	// Try the mkdir first and only stat the path if it already exists, so the
+	// common case of creating a new directory costs a single syscall.
+	// G301: This is a file system tool designed to create directories.
+	// The path is validated and cleaned via ExpandPath before reaching this function.
+	//nolint:gosec // File system tool - user-provided paths are expected and validated
+	err = os.Mkdir(p, 0755)
+	if err != nil && parents && errors.Is(err, fs.ErrNotExist) {
 		//nolint:gosec // File system tool - user-provided paths are expected and validated
 		err = os.MkdirAll(p, 0755)
-	} else {
-		// G301: This is a file system tool designed to create directories.
-		// The path is validated and cleaned via ExpandPath before reaching this function.
-		//nolint:gosec // File system tool - user-provided paths are expected and validated
-		err = os.Mkdir(p, 0755)
 	}
 	if err != nil {
-		if os.IsPermission(err) {
-			return mcpError(fmt.Errorf("permission denied: %s", path))
+		if errors.Is(err, fs.ErrExist) {
+			info, statErr := os.Stat(p)
+			if statErr == nil && info.IsDir() {
+				return mcpSuccess("path", p, "message", "directory already exists")
+			}
+			return mcpError(fmt.Errorf("path exists but is not a directory: %s", path))
 		}
-		return mcpError(err)
+		return mcpPathError(err, path)
 	}
 	return mcpSuccess("path", p)
 }
@@ -334,30 +402,21 @@ func Rm(path string, recursive bool) map[string]any {
 	if err != nil {
 		return mcpError(err)
 	}
-	info, err := os.Stat(p)
-	if err != nil {
-		if os.IsNotExist(err) {
-			return mcpError(fmt.Errorf("path not found: %s", path))
-		}
-		return mcpError(err)
-	}
-	if info.IsDir() {
-		if recursive {
-			err = os.RemoveAll(p)
-		} else {
-			err = os.Remove(p)
-			if err != nil && strings.Contains(err.Error(), "not empty") {
-				return mcpError(fmt.Errorf("directory not empty: %s. use recursive=true", path))
-			}
+	// os.Remove handles files and empty directories alike, so there is no need
+	// to stat the path first; the error tells us whether it was missing or a
+	// non-empty directory.
+	err = os.Remove(p)
+	if errors.Is(err, syscall.ENOTEMPTY) {
+		if !recursive {
+			return mcpError(fmt.Errorf("directory not empty: %s. use recursive=true", path))
 		}
-	} else {
-		err = os.Remove(p)
+		err = os.RemoveAll(p)
 	}
 	if err != nil {
-		if os.IsPermission(err) {
-			return mcpError(fmt.Errorf("permission denied: %s", path))
+		if errors.Is(err, fs.ErrNotExist) {
+			return mcpError(fmt.Errorf("path not found: %s", path))
 		}
-		return mcpError(err)
+		return mcpPathError(err, path)
 	}
 	return mcpSuccess("path", p)
 }
@@ -378,19 +437,17 @@ func Mv(source, dest string) map[string]any {
 	if err != nil {
 		return mcpError(err)
 	}
-	if _, err := os.Stat(src); err != nil {
-		if os.IsNotExist(err) {
-			return mcpError(fmt.Errorf("source not found: %s", source))
-		}
-		return mcpError(err)
-	}
 
 	err = os.Rename(src, dst)
 	if err != nil {
-		if os.IsPermission(err) {
-			return mcpError(fmt.Errorf("permission denied: %s", source))
+		// ENOENT from rename may refer to either side; only report a missing
+		// source if the source really is gone.
+		if errors.Is(err, fs.ErrNotExist) {
+			if _, statErr := os.Lstat(src); errors.Is(statErr, fs.ErrNotExist) {
+				return mcpError(fmt.Errorf("source not found: %s", source))
+			}
 		}
-		return mcpError(err)
+		return mcpPathError(err, source)
 	}
 
 	return mcpSuccess("source", src, "dest", dst)
@@ -412,9 +469,16 @@ func Cp(source, dest string, recursive bool) map[string]any {
 	if err != nil {
 		return mcpError(err)
 	}
-	info, err := os.Stat(src)
+	// Lstat first so a symlink source is left to copyutil, which recreates the
+	// link instead of copying its target. The directory check still follows
+	// the link, which costs a second stat only for symlinks.
+	linkInfo, err := os.Lstat(src)
+	info := linkInfo
+	if err == nil && linkInfo.Mode()&os.ModeSymlink != 0 {
+		info, err = os.Stat(src)
+	}
 	if err != nil {
-		if os.IsNotExist(err) {
+		if errors.Is(err, fs.ErrNotExist) {
 			return mcpError(fmt.Errorf("source not found: %s", source))
 		}
 		return mcpError(err)
@@ -423,18 +487,66 @@ func Cp(source, dest string, recursive bool) map[string]any {
 		return mcpError(fmt.Errorf("source is a directory. use recursive=true"))
 	}
 
-	err = copyutil.Copy(src, dst)
+	if linkInfo.Mode().IsRegular() {
+		err = copyFile(src, dst, info)
+	} else {
+		err = copyutil.Copy(src, dst, copyutil.Options{NumOfWorkers: walkWorkers})
+	}
 	if err != nil {
-		if os.IsPermission(err) {
-			return mcpError(fmt.Errorf("permission denied: %s", source))
-		}
-		return mcpError(err)
+		return mcpPathError(err, source)
 	}
 
 	return mcpSuccess("source", src, "dest", dst)
 }
 
-func itemType(info os.FileInfo) string {
+// copyFile copies the regular file src, described by info, to dst. Where the
+// filesystem supports it dst is a reflink of src and no data is copied at
+// all; otherwise the data is moved with (*os.File).ReadFrom, which on Linux
+// uses copy_file_range so the bytes stay in the kernel instead of passing
+// through a user-space buffer.
+// Like copyutil.Copy, it creates missing parent directories of dst with
+// os.ModePerm and gives dst the mode of src, including the setuid, setgid and
+// sticky bits.
+func copyFile(src, dst string, info os.FileInfo) (err error) {
+	//nolint:gosec // File system tool - user-provided paths are expected and validated
+	in, err := os.Open(src)
+	if err != nil {
+		return err
+	}
+	//nolint:errcheck // Read-only descriptor; a close error cannot lose data
+	defer in.Close()
+
+	//nolint:gosec // File system tool - user-provided paths are expected and validated
+	if err := os.MkdirAll(filepath.Dir(dst), os.ModePerm); err != nil {
+		return err
+	}
+
+	// G304: This is a file system tool designed to copy user-provided paths.
+	//nolint:gosec // File system tool - user-provided paths are expected and validated
+	out, err := os.OpenFile(dst, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, info.Mode().Perm())
+	if err != nil {
+		return err
+	}
+	defer func() {
+		if closeErr := out.Close(); err == nil {
+			err = closeErr
+		}
+	}()
+
+	// Try a reflink first. Any failure, for example EOPNOTSUPP or EXDEV, just
+	// means the data has to be copied.
+	if cloneFile(out, in) != nil {
+		if _, err := out.ReadFrom(in); err != nil {
+			return err
+		}
+	}
+	// OpenFile leaves the mode of an existing file alone and applies the
+	// umask to a new one, so set it explicitly.
+	return out.Chmod(info.Mode() & (os.ModePerm | os.ModeSetuid | os.ModeSetgid | os.ModeSticky))
+}
+
+// itemType reports the listing type of an os.FileInfo or fs.DirEntry.
+func itemType(info interface{ IsDir() bool }) string {
 	if info.IsDir() {
 		return "directory"
 	}
@@ -2,8 +2,12 @@
 package fs
 
 import (
+	"errors"
+	"fmt"
+	"io/fs"
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -80,6 +84,11 @@ func TestRead(t *testing.T) {
 	//nolint:gosec // Test file - write to test file
 	require.NoError(t, os.WriteFile(testFile, []byte(testContent), 0644))
 
+	largeFile := filepath.Join(tmpDir, "large.txt")
+	largeContent := strings.Repeat("0123456789abcdef", 1<<16)
+	//nolint:gosec // Test file - write to test file
+	require.NoError(t, os.WriteFile(largeFile, []byte(largeContent), 0644))
+
 	tests := []struct {
 		name    string
 		path    string
@@ -92,6 +101,12 @@ func TestRead(t *testing.T) {
 			wantErr: false,
 			want:    testContent,
 		},
+		{
+			name:    "read large file",
+			path:    largeFile,
+			wantErr: false,
+			want:    largeContent,
+		},
 		{
 			name:    "empty path",
 			path:    "",
@@ -265,9 +280,9 @@ func TestList(t *testing.T) {
 			if tt.hasRelative {
 				hasRelative := false
 				for _, item := range items {
-					if _, ok := item["relative"]; ok {
+					if rel, ok := item["relative"].(string); ok {
 						hasRelative = true
-						break
+						assert.Equal(t, item["path"], filepath.Join(tt.path, rel))
 					}
 				}
 				assert.True(t, hasRelative, "recursive list should include relative paths")
@@ -276,6 +291,80 @@ func TestList(t *testing.T) {
 	}
 }
 
+func TestListRecursiveMatchesWalkDir(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	// More subdirectories than the walker reads ahead, so some are read on
+	// demand as the traversal reaches them, each with nested content.
+	for i := 0; i < walkPrefetch+walkWorkers; i++ {
+		dir := filepath.Join(tmpDir, fmt.Sprintf("dir%03d", i), "nested", "deeper")
+		//nolint:gosec // Test directory permissions are acceptable for temporary test files
+		require.NoError(t, os.MkdirAll(dir, 0755))
+		//nolint:gosec // Test file permissions are acceptable for temporary test files
+		require.NoError(t, os.WriteFile(filepath.Join(dir, "file.txt"), []byte("x"), 0644))
+		//nolint:gosec // Test file permissions are acceptable for temporary test files
+		require.NoError(t, os.WriteFile(filepath.Join(tmpDir, fmt.Sprintf("file%03d.txt", i)), []byte("x"), 0644))
+	}
+
+	var want []string
+	require.NoError(t, filepath.WalkDir(tmpDir, func(path string, d fs.DirEntry, err error) error {
+		if err == nil && path != tmpDir {
+			want = append(want, path)
+		}
+		return err
+	}))
+
+	result := List(tmpDir, true)
+	//nolint:errcheck // Type assertion in test is safe
+	require.True(t, result["success"].(bool))
+	items, ok := result["items"].([]map[string]any)
+	require.True(t, ok, "items should be []map[string]any")
+
+	got := make([]string, len(items))
+	for i, item := range items {
+		//nolint:errcheck // Type assertion in test is safe
+		got[i] = item["path"].(string)
+	}
+	assert.Equal(t, want, got)
+}
+
+func TestListStream(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	//nolint:gosec // Test file permissions are acceptable for temporary test files
+	require.NoError(t, os.WriteFile(filepath.Join(tmpDir, "file1.txt"), []byte("content1"), 0644))
+	//nolint:gosec // Test directory permissions are acceptable for temporary test files
+	require.NoError(t, os.MkdirAll(filepath.Join(tmpDir, "subdir"), 0755))
+	//nolint:gosec // Test file permissions are acceptable for temporary test files
+	require.NoError(t, os.WriteFile(filepath.Join(tmpDir, "subdir", "file2.txt"), []byte("content2"), 0644))
+
+	t.Run("emits every item", func(t *testing.T) {
+		var items []map[string]any
+		result := ListStream(tmpDir, true, func(item map[string]any) error {
+			items = append(items, item)
+			return nil
+		})
+		//nolint:errcheck // Type assertion in test is safe
+		assert.True(t, result["success"].(bool))
+		assert.Equal(t, List(tmpDir, true)["items"], items)
+		assert.Equal(t, len(items), result["count"])
+		_, hasItems := result["items"]
+		assert.False(t, hasItems, "streamed result should not carry items")
+	})
+
+	t.Run("emit error stops listing", func(t *testing.T) {
+		calls := 0
+		result := ListStream(tmpDir, false, func(item map[string]any) error {
+			calls++
+			return errors.New("write failed")
+		})
+		//nolint:errcheck // Type assertion in test is safe
+		assert.False(t, result["success"].(bool))
+		assert.Equal(t, "write failed", result["error"])
+		assert.Equal(t, 1, calls)
+	})
+}
+
 func TestExists(t *testing.T) {
 	tmpDir := t.TempDir()
 	testFile := filepath.Join(tmpDir, "test.txt")
@@ -416,6 +505,9 @@ func TestStat(t *testing.T) {
 
 func TestMkdir(t *testing.T) {
 	tmpDir := t.TempDir()
+	existingFile := filepath.Join(tmpDir, "file.txt")
+	//nolint:gosec // Test file permissions are acceptable for temporary test files
+	require.NoError(t, os.WriteFile(existingFile, []byte("test"), 0644))
 
 	tests := []struct {
 		name    string
@@ -466,6 +558,12 @@ func TestMkdir(t *testing.T) {
 				assert.Equal(t, "directory already exists", result["message"])
 			},
 		},
+		{
+			name:    "file exists at path",
+			path:    existingFile,
+			parents: true,
+			wantErr: true,
+		},
 		{
 			name:    "empty path",
 			path:    "",
@@ -549,6 +647,29 @@ func TestRm(t *testing.T) {
 				assert.True(t, result["success"].(bool))
 			},
 		},
+		{
+			name: "remove nested directory tree recursively",
+			setup: func() string {
+				testDir := filepath.Join(tmpDir, "tree")
+				for _, sub := range []string{"a/b/c", "a/d", "e"} {
+					dir := filepath.Join(testDir, filepath.FromSlash(sub))
+					//nolint:gosec // Test directory permissions are acceptable for temporary test files
+					require.NoError(t, os.MkdirAll(dir, 0755))
+					//nolint:gosec // Test file permissions are acceptable for temporary test files
+					require.NoError(t, os.WriteFile(filepath.Join(dir, "file.txt"), []byte("test"), 0644))
+				}
+				return testDir
+			},
+			recursive: true,
+			wantErr:   false,
+			check: func(t *testing.T, result map[string]any, path string) {
+				//nolint:errcheck // Type assertion in test is safe
+				assert.True(t, result["success"].(bool))
+				//nolint:gosec // Test file paths are safe - constructed from test temp directories
+				_, err := os.Stat(path)
+				assert.True(t, os.IsNotExist(err))
+			},
+		},
 		{
 			name: "remove non-empty directory without recursive",
 			setup: func() string {
@@ -747,6 +868,73 @@ func TestCp(t *testing.T) {
 				assert.NoError(t, err)
 			},
 		},
+		{
+			name: "copy file preserves permissions",
+			setup: func() (string, string) {
+				source := filepath.Join(tmpDir, "private.txt")
+				dest := filepath.Join(tmpDir, "private-copy.txt")
+				require.NoError(t, os.WriteFile(source, []byte("secret"), 0600))
+				// An existing destination keeps its mode on open, so this
+				// checks the mode is set explicitly.
+				//nolint:gosec // Test file permissions are acceptable for temporary test files
+				require.NoError(t, os.WriteFile(dest, []byte("old"), 0644))
+				return source, dest
+			},
+			recursive: false,
+			wantErr:   false,
+			check: func(t *testing.T, result map[string]any, source, dest string) {
+				//nolint:errcheck // Type assertion in test is safe
+				assert.True(t, result["success"].(bool))
+				info, err := os.Stat(dest)
+				require.NoError(t, err)
+				assert.Equal(t, os.FileMode(0600), info.Mode().Perm())
+				//nolint:gosec // Test file paths are safe - constructed from test temp directories
+				data, err := os.ReadFile(dest)
+				require.NoError(t, err)
+				assert.Equal(t, "secret", string(data))
+			},
+		},
+		{
+			name: "copy file into missing directory",
+			setup: func() (string, string) {
+				source := filepath.Join(tmpDir, "nested-source.txt")
+				dest := filepath.Join(tmpDir, "missing", "parent", "dest.txt")
+				//nolint:gosec // Test file permissions are acceptable for temporary test files
+				require.NoError(t, os.WriteFile(source, []byte("nested"), 0644))
+				return source, dest
+			},
+			recursive: false,
+			wantErr:   false,
+			check: func(t *testing.T, result map[string]any, source, dest string) {
+				//nolint:errcheck // Type assertion in test is safe
+				assert.True(t, result["success"].(bool))
+				//nolint:gosec // Test file paths are safe - constructed from test temp directories
+				data, err := os.ReadFile(dest)
+				require.NoError(t, err)
+				assert.Equal(t, "nested", string(data))
+			},
+		},
+		{
+			name: "copy symlink",
+			setup: func() (string, string) {
+				target := filepath.Join(tmpDir, "target.txt")
+				source := filepath.Join(tmpDir, "link.txt")
+				dest := filepath.Join(tmpDir, "link-copy.txt")
+				//nolint:gosec // Test file permissions are acceptable for temporary test files
+				require.NoError(t, os.WriteFile(target, []byte("target"), 0644))
+				require.NoError(t, os.Symlink(target, source))
+				return source, dest
+			},
+			recursive: false,
+			wantErr:   false,
+			check: func(t *testing.T, result map[string]any, source, dest string) {
+				//nolint:errcheck // Type assertion in test is safe
+				assert.True(t, result["success"].(bool))
+				info, err := os.Lstat(dest)
+				require.NoError(t, err)
+				assert.True(t, info.Mode()&os.ModeSymlink != 0, "symlink source should be copied as a symlink")
+			},
+		},
 		{
 			name: "copy directory without recursive",
 			setup: func() (string, string) {
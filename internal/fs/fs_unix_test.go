@@ -0,0 +1,49 @@
+//go:build unix
+
+package fs
+
+import (
+	"os"
+	"path/filepath"
+	"syscall"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestReadFIFO(t *testing.T) {
+	fifo := filepath.Join(t.TempDir(), "fifo")
+	require.NoError(t, syscall.Mkfifo(fifo, 0600))
+
+	done := make(chan map[string]any, 1)
+	go func() { done <- Read(fifo) }()
+
+	select {
+	case result := <-done:
+		//nolint:errcheck // Type assertion in test is safe
+		assert.False(t, result["success"].(bool))
+		assert.Equal(t, "path is not a file: "+fifo, result["error"])
+	case <-time.After(5 * time.Second):
+		t.Fatal("Read blocked on a FIFO with no writer")
+	}
+}
+
+func TestCpPreservesSpecialBits(t *testing.T) {
+	tmpDir := t.TempDir()
+	source := filepath.Join(tmpDir, "setgid.sh")
+	dest := filepath.Join(tmpDir, "setgid-copy.sh")
+	//nolint:gosec // Test file permissions are acceptable for temporary test files
+	require.NoError(t, os.WriteFile(source, []byte("#!/bin/sh\n"), 0755))
+	// Set the bits explicitly: the umask does not apply to chmod.
+	require.NoError(t, os.Chmod(source, 0755|os.ModeSetgid|os.ModeSticky))
+
+	result := Cp(source, dest, false)
+	//nolint:errcheck // Type assertion in test is safe
+	require.True(t, result["success"].(bool))
+
+	info, err := os.Stat(dest)
+	require.NoError(t, err)
+	assert.Equal(t, 0755|os.ModeSetgid|os.ModeSticky, info.Mode()&(os.ModePerm|os.ModeSetuid|os.ModeSetgid|os.ModeSticky))
+}
@@ -0,0 +1,30 @@
+package fs
+
+import (
+	"errors"
+	"os"
+
+	"golang.org/x/sys/unix"
+)
+
+// openForRead opens p read-only without blocking and without updating its
+// access time. O_NONBLOCK keeps opening a FIFO or device from hanging until
+// the caller can reject it as not a regular file; it has no effect on reads
+// from regular files. O_NOATIME is only permitted for the file's owner, so
+// fall back to an open without it when the kernel refuses.
+func openForRead(p string) (*os.File, error) {
+	//nolint:gosec // File system tool - user-provided paths are expected and validated
+	f, err := os.OpenFile(p, os.O_RDONLY|unix.O_NONBLOCK|unix.O_NOATIME, 0)
+	if errors.Is(err, unix.EPERM) {
+		//nolint:gosec // File system tool - user-provided paths are expected and validated
+		return os.OpenFile(p, os.O_RDONLY|unix.O_NONBLOCK, 0)
+	}
+	return f, err
+}
+
+// adviseSequential tells the kernel f is about to be read front to back so it
+// can read ahead aggressively.
+func adviseSequential(f *os.File) {
+	//nolint:errcheck // Advisory hint; failure is harmless
+	unix.Fadvise(int(f.Fd()), 0, 0, unix.FADV_SEQUENTIAL)
+}
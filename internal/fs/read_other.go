@@ -0,0 +1,19 @@
+//go:build !linux
+
+package fs
+
+import (
+	"os"
+	"syscall"
+)
+
+// openForRead opens p read-only without blocking. O_NONBLOCK keeps opening a
+// FIFO or device from hanging until the caller can reject it as not a regular
+// file; it has no effect on reads from regular files.
+func openForRead(p string) (*os.File, error) {
+	//nolint:gosec // File system tool - user-provided paths are expected and validated
+	return os.OpenFile(p, os.O_RDONLY|syscall.O_NONBLOCK, 0)
+}
+
+// adviseSequential is a no-op on platforms without posix_fadvise.
+func adviseSequential(_ *os.File) {}
@@ -0,0 +1,86 @@
+package fs
+
+import (
+	"io/fs"
+	"os"
+	"path/filepath"
+)
+
+// walkWorkers bounds how many directories the recursive operations read or
+// copy at once. The work is dominated by filesystem syscalls rather than
+// CPU, so this is independent of GOMAXPROCS.
+const walkWorkers = 8
+
+// walkPrefetch bounds how many directory listings may be read ahead of the
+// traversal at any time, which keeps memory flat on very wide trees.
+const walkPrefetch = 8 * walkWorkers
+
+// dirListing is the result of reading one directory, available once done is
+// closed.
+type dirListing struct {
+	entries []fs.DirEntry
+	err     error
+	done    chan struct{}
+}
+
+// walker walks a tree in the same order as filepath.WalkDir, but reads the
+// subdirectories of each directory concurrently while their earlier siblings
+// are being visited. Only the reads run in parallel; fn is always called from
+// the goroutine that called walk.
+type walker struct {
+	sem     chan struct{}
+	pending int
+}
+
+func newWalker() *walker {
+	return &walker{sem: make(chan struct{}, walkWorkers)}
+}
+
+// read starts reading dir in the background.
+func (w *walker) read(dir string) *dirListing {
+	l := &dirListing{done: make(chan struct{})}
+	w.pending++
+	go func() {
+		w.sem <- struct{}{}
+		l.entries, l.err = os.ReadDir(dir)
+		<-w.sem
+		close(l.done)
+	}()
+	return l
+}
+
+// walk calls fn for every entry below the directory whose listing is l.
+// prefix is that directory's path followed by a separator; fn receives each
+// entry's full path.
+func (w *walker) walk(prefix string, l *dirListing, fn func(path string, d fs.DirEntry) error) error {
+	<-l.done
+	w.pending--
+	if l.err != nil {
+		return l.err
+	}
+
+	subdirs := make([]*dirListing, len(l.entries))
+	for i, entry := range l.entries {
+		if entry.IsDir() && w.pending < walkPrefetch {
+			subdirs[i] = w.read(prefix + entry.Name())
+		}
+	}
+
+	for i, entry := range l.entries {
+		path := prefix + entry.Name()
+		if err := fn(path, entry); err != nil {
+			return err
+		}
+		if !entry.IsDir() {
+			continue
+		}
+		sub := subdirs[i]
+		if sub == nil {
+			sub = w.read(path)
+		}
+		if err := w.walk(path+string(filepath.Separator), sub, fn); err != nil {
+			return err
+		}
+	}
+	return nil
+}